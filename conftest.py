@@ -0,0 +1,164 @@
+"""Pytest plugin that collects every project case as its own test item.
+
+Running ``pytest`` from the repository root replaces the collection of
+``test_projects.py`` with one item per ``(project, case)`` pair, including
+each interactive case, so ``pytest -n auto`` (pytest-xdist) spreads the cases
+over all cores and reports every failure.
+"""
+
+import functools
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import test_projects
+
+RUNNER_PATH = Path(test_projects.__file__).resolve()
+
+
+class ProjectBuildError(Exception):
+    """Raised when a project cannot be compiled or is misconfigured."""
+
+
+def pytest_pycollect_makemodule(module_path: Path, parent: pytest.Collector) -> pytest.Module | None:
+    """Collect ``test_projects.py`` through :class:`ProjectCasesModule`.
+
+    Returns
+    -------
+    pytest.Module | None
+        The case collector for the runner script, otherwise ``None``.
+    """
+    if module_path.resolve() == RUNNER_PATH:
+        return ProjectCasesModule.from_parent(parent, path=module_path)
+    return None
+
+
+class ProjectCasesModule(pytest.Module):
+    """Yield one test item per project case instead of the script's functions."""
+
+    def collect(self) -> Iterator[pytest.Item]:
+        """Build items from :func:`test_projects.list_work_items`.
+
+        Yields
+        ------
+        pytest.Item
+            One item per regular or interactive case, plus one failing item
+            for each project whose cases cannot be listed.
+        """
+        for project, case_name in test_projects.list_work_items(test_projects.list_projects()):
+            if case_name is None:
+                run = _run_project_error
+            elif _is_interactive(project):
+                run = _run_interactive_case
+            else:
+                run = _run_project_case
+            yield pytest.Function.from_parent(
+                self,
+                name=f"{project}[{case_name or 'project'}]",
+                callobj=functools.partial(run, project=project, case_name=case_name),
+            )
+
+
+def _is_interactive(project: str) -> bool:
+    config = test_projects.load_project_config(test_projects.ROOT / project)
+    return bool(config) and config.get('type') == 'interactive'
+
+
+@pytest.fixture(scope='session')
+def project_builds() -> Callable[[str], dict[str, Any]]:
+    """Compile projects on first use and share the result for the session.
+
+    Compilation goes through :func:`test_projects.compile_source_cached`, so
+    xdist workers reuse one another's binaries instead of rebuilding.
+
+    Returns
+    -------
+    Callable[[str], dict[str, Any]]
+        Function returning the build details for a project name.
+    """
+    cache: dict[str, dict[str, Any] | ProjectBuildError] = {}
+
+    def build(project: str) -> dict[str, Any]:
+        if project not in cache:
+            try:
+                cache[project] = _build_project(project)
+            except ProjectBuildError as error:
+                cache[project] = error
+        outcome = cache[project]
+        if isinstance(outcome, ProjectBuildError):
+            pytest.fail(str(outcome), pytrace=False)
+        return outcome
+
+    return build
+
+
+def _build_project(project: str) -> dict[str, Any]:
+    project_dir = test_projects.ROOT / project
+    config = test_projects.load_project_config(project_dir) or {}
+    if config.get('type') == 'interactive':
+        return _build_interactive_project(project_dir, config)
+
+    try:
+        _, digests = test_projects.inspect_case_dir(project_dir / test_projects.CASE_DIR_NAME)
+    except (OSError, ValueError) as error:
+        raise ProjectBuildError(f'Failed to load {test_projects.MANIFEST_FILE_NAME}: {error}') from error
+    return {'solution': _compile(project_dir, test_projects.DEFAULT_SOURCE_NAME, project), 'digests': digests}
+
+
+def _build_interactive_project(project_dir: Path, config: dict[str, Any]) -> dict[str, Any]:
+    problem = test_projects.check_interactive_config(project_dir, config)
+    if problem is not None:
+        raise ProjectBuildError(problem)
+    try:
+        timeout = test_projects.parse_interactive_timeout(project_dir, config)
+    except ValueError as error:
+        raise ProjectBuildError(str(error)) from error
+    return {
+        'solution': _compile(project_dir, test_projects.DEFAULT_SOURCE_NAME, project_dir.name),
+        'judge': _compile(project_dir, config['judge_source'], f'{project_dir.name}_judge'),
+        'runner': project_dir / config['runner'],
+        'cases_file': project_dir / config['cases_file'],
+        'timeout': timeout,
+    }
+
+
+def _compile(project_dir: Path, source_name: str, output_name: str) -> Path:
+    try:
+        return test_projects.compile_source_cached(project_dir, source_name, output_name)
+    except (RuntimeError, OSError) as error:
+        raise ProjectBuildError(str(error)) from error
+
+
+def _run_project_case(project_builds: Callable[[str], dict[str, Any]], *, project: str, case_name: str) -> None:
+    build = project_builds(project)
+    case_dir = test_projects.ROOT / project / test_projects.CASE_DIR_NAME
+    success, message = test_projects.run_single_case(
+        build['solution'],
+        case_dir / f'{case_name}.in',
+        case_dir / f'{case_name}.out',
+        expected_digest=build['digests'].get(case_name),
+    )
+    if not success:
+        pytest.fail(message, pytrace=False)
+
+
+def _run_interactive_case(project_builds: Callable[[str], dict[str, Any]], *, project: str, case_name: str) -> None:
+    build = project_builds(project)
+    success, message = test_projects.run_interactive_case(
+        build['runner'],
+        build['cases_file'],
+        case_name,
+        build['judge'],
+        build['solution'],
+        timeout=build['timeout'],
+    )
+    if not success:
+        pytest.fail(message, pytrace=False)
+
+
+def _run_project_error(*, project: str, case_name: None) -> None:
+    del case_name
+    success, messages = test_projects.test_project(project, case_names=())
+    pytest.fail('\n'.join(messages) if not success else f"No cases found for project '{project}'.", pytrace=False)
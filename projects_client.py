@@ -0,0 +1,117 @@
+"""Thin client for the ``test_projects.py serve`` daemon.
+
+Forwards tester arguments over the daemon's Unix socket and streams back the
+output and exit code. It imports only what a request needs, so a call to a
+warm daemon is not dominated by loading the full tester; the tester itself is
+only imported when no trusted daemon is listening and the run happens locally.
+"""
+
+import importlib
+import json
+import os
+import socket
+import struct
+import sys
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+# The daemon socket lives in a directory only the current user can enter.
+DEFAULT_SOCKET_DIR = Path(os.environ.get('XDG_RUNTIME_DIR') or os.environ.get('TMPDIR') or '/tmp') / (
+    f'test_projects-{os.getuid()}'
+)
+DEFAULT_SOCKET_PATH = DEFAULT_SOCKET_DIR / f'{zlib.crc32(str(ROOT).encode()):08x}.sock'
+
+
+def peer_uid(connection: socket.socket) -> int | None:
+    """Return the user id of the process on the other end of a Unix socket.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        Connected Unix socket.
+
+    Returns
+    -------
+    int | None
+        Peer user id, or ``None`` where ``SO_PEERCRED`` is unavailable.
+    """
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return None
+    credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    return struct.unpack('3i', credentials)[1]
+
+
+def connect(socket_path: Path) -> socket.socket | None:
+    """Connect to a daemon run by the current user.
+
+    Parameters
+    ----------
+    socket_path : Path
+        Unix socket the daemon listens on.
+
+    Returns
+    -------
+    socket.socket | None
+        Open connection, or ``None`` when nothing trusted is listening.
+    """
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(str(socket_path))
+    except OSError:
+        connection.close()
+        print(f'No daemon listening on {socket_path}; running locally.', file=sys.stderr)
+        return None
+    if (uid := peer_uid(connection)) not in {None, os.getuid()}:
+        connection.close()
+        print(f'Ignoring the daemon on {socket_path} run by uid {uid}; running locally.', file=sys.stderr)
+        return None
+    return connection
+
+
+def main(argv: list[str], run_locally: Callable[[list[str]], int] | None = None) -> int:
+    """Forward CLI arguments to a running daemon and stream back its output.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Tester arguments, optionally starting with ``--socket PATH``.
+    run_locally : Callable[[list[str]], int] | None, optional
+        Tester entry point used when no trusted daemon is listening; defaults
+        to ``test_projects.main``.
+
+    Returns
+    -------
+    int
+        Exit code of the forwarded command.
+    """
+    socket_path = DEFAULT_SOCKET_PATH
+    if argv[:1] == ['--socket'] and len(argv) > 1:
+        socket_path, argv = Path(argv[1]), argv[2:]
+    elif argv and argv[0].startswith('--socket='):
+        socket_path, argv = Path(argv[0].partition('=')[2]), argv[1:]
+
+    connection = connect(socket_path)
+    if connection is None:
+        return (run_locally or importlib.import_module('test_projects').main)(argv)
+
+    with connection, connection.makefile('r', encoding='utf-8') as reader, connection.makefile(
+        'w',
+        encoding='utf-8',
+    ) as writer:
+        writer.write(json.dumps({'argv': argv, 'cwd': str(Path.cwd())}) + '\n')
+        writer.flush()
+        for line in reader:
+            message = json.loads(line)
+            if 'exit' in message:
+                return int(message['exit'])
+            stream = sys.stderr if 'stderr' in message else sys.stdout
+            stream.write(message.get('stderr', message.get('stdout', '')))
+            stream.flush()
+    print('Daemon closed the connection before reporting an exit status.', file=sys.stderr)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
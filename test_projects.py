@@ -1,19 +1,117 @@
 """Compile and test configured C projects against their cases."""
 
 import argparse
+import concurrent.futures
+import contextlib
+import fcntl
+import functools
+import hashlib
+import io
 import json
+import math
+import multiprocessing
+import os
+import signal
+import socket
+import stat
+import statistics
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections.abc import Callable, Collection, Generator, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, TypeVar
+
+import projects_client
+from projects_client import DEFAULT_SOCKET_DIR, DEFAULT_SOCKET_PATH
 
 ROOT = Path(__file__).resolve().parent
 CASE_DIR_NAME = 'cases'
 CONFIG_FILE_NAME = 'test_config.json'
 DEFAULT_BUILD_DIR_NAME = 'build'
 DEFAULT_SOURCE_NAME = 'main.c'
+COMPILE_FLAGS = ('-std=c11', '-Wall', '-Wextra', '-O2')
+MANIFEST_FILE_NAME = 'manifest.json'
+MANIFEST_DIGEST_SIZE = 16
+STREAM_CHUNK_SIZE = 1 << 16
+STAGE_MODES = ('cold', 'warm', 'memfd')
+IO_STAT_FIELDS = ('rchar', 'wchar', 'syscr', 'syscw')
+DEFAULT_MIN_WRITE_BYTES = 1024
+# Programs with only a handful of writes are not worth flagging for small writes.
+IO_FLAG_MIN_WRITES = 16
+DEFAULT_AB_TIMEOUT = 60.0
+# A confidence interval needs at least two paired samples.
+MIN_CONFIDENCE_SAMPLES = 2
+# ddmin splits the input into at least this many chunks.
+DDMIN_MIN_GRANULARITY = 2
+# Two-sided 95% Student's t critical values indexed by degrees of freedom (1-30).
+T_CRITICAL_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+T = TypeVar('T')
+# A (project, case) pair; the case is None for a project whose cases cannot be listed.
+WorkItem = tuple[str, str | None]
+
+# Populated only while `serve` is running: results keyed by function and arguments,
+# each stored with the stat signature of the files it was derived from.
+_SERVING = threading.Event()
+_SERVE_CACHE: dict[tuple[Any, ...], tuple[tuple[Any, ...], Any]] = {}
+# Per-thread writer of the daemon client whose request the thread is running.
+_CLIENT_STREAMS = threading.local()
+
+
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        status = path.stat()
+    except OSError:
+        return None
+    return status.st_mtime_ns, status.st_size
+
+
+def _serve_cached(dependencies: Callable[..., tuple[Path, ...]]) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Reuse a function's result in the daemon until its dependencies change.
+
+    Outside ``serve`` mode the wrapped function always runs.
+
+    Parameters
+    ----------
+    dependencies : Callable[..., tuple[Path, ...]]
+        Maps the call's positional arguments to the files whose modification
+        time and size invalidate the cached result.
+
+    Returns
+    -------
+    Callable[[Callable[..., T]], Callable[..., T]]
+        Decorator applying the cache.
+    """
+
+    def decorate(function: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(function)
+        def wrapper(*args: Any) -> T:
+            if not _SERVING.is_set():
+                return function(*args)
+            key = (function.__name__, *args)
+            signature = tuple(_stat_signature(path) for path in dependencies(*args))
+            cached = _SERVE_CACHE.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            value = function(*args)
+            # Re-stat afterwards: the call itself may have produced a dependency (e.g. a binary).
+            _SERVE_CACHE[key] = (tuple(_stat_signature(path) for path in dependencies(*args)), value)
+            return value
+
+        return wrapper
+
+    return decorate
 
 
+@_serve_cached(lambda: (ROOT,))
 def list_projects() -> list[str]:
     """Return repository directories that contain the expected source file.
 
@@ -49,6 +147,7 @@ def find_case_dir(project_dir: Path) -> Path | None:
     return None
 
 
+@_serve_cached(lambda project_dir: (project_dir / CONFIG_FILE_NAME,))
 def load_project_config(project_dir: Path) -> dict[str, Any] | None:
     """Load optional project-specific configuration file.
 
@@ -69,6 +168,12 @@ def load_project_config(project_dir: Path) -> dict[str, Any] | None:
         return json.load(handle)
 
 
+@_serve_cached(
+    lambda project_dir, source_name, output_name: (
+        project_dir / source_name,
+        project_dir / DEFAULT_BUILD_DIR_NAME / output_name,
+    ),
+)
 def compile_source(project_dir: Path, source_name: str, output_name: str) -> Path:
     """Compile the provided source file and return the emitted binary path.
 
@@ -92,10 +197,7 @@ def compile_source(project_dir: Path, source_name: str, output_name: str) -> Pat
 
     compile_cmd = [
         'gcc',
-        '-std=c11',
-        '-Wall',
-        '-Wextra',
-        '-O2',
+        *COMPILE_FLAGS,
         str(project_dir / source_name),
         '-o',
         str(binary_path),
@@ -125,9 +227,251 @@ def compile_project(project_dir: Path) -> Path:
     return compile_source(project_dir, DEFAULT_SOURCE_NAME, project_dir.name)
 
 
+def compile_source_cached(project_dir: Path, source_name: str, output_name: str) -> Path:
+    """Compile the source only if it or the compiler flags changed since the last build.
+
+    A stamp file records what the binary was built from, and builds hold an
+    exclusive lock in the build directory so concurrent processes (such as
+    pytest-xdist workers) share a single compilation.
+
+    Parameters
+    ----------
+    project_dir : Path
+        Directory containing the project sources.
+    source_name : str
+        Relative source filename to compile.
+    output_name : str
+        Desired output binary name.
+
+    Returns
+    -------
+    Path
+        Filesystem path to the compiled binary.
+    """
+    build_dir = project_dir / DEFAULT_BUILD_DIR_NAME
+    build_dir.mkdir(exist_ok=True)
+    binary_path = build_dir / output_name
+    stamp_path = build_dir / f'{output_name}.stamp'
+    hasher = hashlib.blake2b(digest_size=MANIFEST_DIGEST_SIZE)
+    hasher.update((project_dir / source_name).read_bytes())
+    hasher.update('\0'.join(COMPILE_FLAGS).encode())
+    build_key = hasher.hexdigest()
+
+    with (build_dir / f'{output_name}.lock').open('w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if binary_path.is_file() and stamp_path.is_file() and stamp_path.read_text() == build_key:
+            return binary_path
+        stamp_path.unlink(missing_ok=True)
+        compile_source(project_dir, source_name, output_name)
+        stamp_path.write_text(build_key)
+    return binary_path
+
+
+def hash_file(path: Path) -> tuple[int, str]:
+    """Return the size and BLAKE2 digest of a file.
+
+    Parameters
+    ----------
+    path : Path
+        File to hash.
+
+    Returns
+    -------
+    tuple[int, str]
+        Size in bytes and hexadecimal digest.
+    """
+    hasher = hashlib.blake2b(digest_size=MANIFEST_DIGEST_SIZE)
+    size = 0
+    with path.open('rb') as handle:
+        while chunk := handle.read(STREAM_CHUNK_SIZE):
+            hasher.update(chunk)
+            size += len(chunk)
+    return size, hasher.hexdigest()
+
+
+def build_case_manifest(case_dir: Path) -> dict[str, Any]:
+    """Describe every paired case in the directory with sizes and digests.
+
+    Parameters
+    ----------
+    case_dir : Path
+        Directory holding `.in` and `.out` files.
+
+    Returns
+    -------
+    dict[str, Any]
+        Manifest payload ready to be serialised to JSON.
+    """
+    cases = []
+    for input_case in sorted(case_dir.glob('*.in')):
+        expected = input_case.with_suffix('.out')
+        if not expected.is_file():
+            continue
+        input_size, input_digest = hash_file(input_case)
+        output_size, output_digest = hash_file(expected)
+        cases.append(
+            {
+                'name': input_case.stem,
+                'input_size': input_size,
+                'input_digest': input_digest,
+                'output_size': output_size,
+                'output_digest': output_digest,
+            },
+        )
+    return {'algorithm': f'blake2b-{MANIFEST_DIGEST_SIZE * 8}', 'cases': cases}
+
+
+@_serve_cached(lambda case_dir: (case_dir / MANIFEST_FILE_NAME,))
+def load_case_manifest(case_dir: Path) -> dict[str, Any] | None:
+    """Load the optional case manifest for a cases directory.
+
+    Parameters
+    ----------
+    case_dir : Path
+        Directory holding `.in` and `.out` files.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Parsed manifest when present.
+
+    Raises
+    ------
+    ValueError
+        If the file is not valid JSON or does not follow the manifest schema.
+    """
+    manifest_path = case_dir / MANIFEST_FILE_NAME
+    if not manifest_path.is_file():
+        return None
+    with manifest_path.open('r', encoding='utf-8') as handle:
+        manifest = json.load(handle)
+    problem = case_manifest_problem(manifest)
+    if problem is not None:
+        raise ValueError(problem)
+    return manifest
+
+
+def case_manifest_problem(manifest: object) -> str | None:
+    """Check that parsed JSON has the shape written by :func:`build_case_manifest`.
+
+    Parameters
+    ----------
+    manifest : object
+        Parsed manifest content.
+
+    Returns
+    -------
+    str | None
+        Description of the first missing or mistyped field, if any.
+    """
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('cases'), list):
+        return "expected an object with a 'cases' list"
+    for index, entry in enumerate(manifest['cases']):
+        if not isinstance(entry, dict):
+            return f'case #{index + 1} is not an object'
+        name = entry.get('name')
+        if not isinstance(name, str) or not name or '/' in name:
+            return f"case #{index + 1} has an invalid 'name'"
+        for kind in ('input', 'output'):
+            size, digest = entry.get(f'{kind}_size'), entry.get(f'{kind}_digest')
+            if not isinstance(size, int) or isinstance(size, bool) or size < 0:
+                return f"case '{name}' has an invalid '{kind}_size'"
+            if not isinstance(digest, str):
+                return f"case '{name}' has an invalid '{kind}_digest'"
+    return None
+
+
+def check_case_files(
+    case_dir: Path,
+    manifest: dict[str, Any] | None,
+    *,
+    verify_digests: bool = False,
+    trusted_digests: dict[str, tuple[int, str]] | None = None,
+) -> list[str]:
+    """Report orphaned, unlisted, missing, or corrupted case files.
+
+    Sizes are always compared against the manifest. Expected outputs modified
+    after the manifest was written are re-hashed, since an edit need not
+    change the size; every file is re-hashed when ``verify_digests`` is set.
+
+    Parameters
+    ----------
+    case_dir : Path
+        Directory holding `.in` and `.out` files.
+    manifest : dict[str, Any] | None
+        Parsed manifest, if the directory has one.
+    verify_digests : bool, optional
+        Re-hash every listed file and compare digests.
+    trusted_digests : dict[str, tuple[int, str]] | None, optional
+        Filled with the output size and digest of every case whose expected
+        output passed these checks.
+
+    Returns
+    -------
+    list[str]
+        Human-readable problem descriptions (empty when consistent).
+    """
+    problems: list[str] = []
+    inputs = {path.stem for path in case_dir.glob('*.in')}
+    outputs = {path.stem for path in case_dir.glob('*.out')}
+    problems.extend(f"Orphaned input '{stem}.in' has no matching '.out' file." for stem in sorted(inputs - outputs))
+    problems.extend(f"Orphaned output '{stem}.out' has no matching '.in' file." for stem in sorted(outputs - inputs))
+    if manifest is None:
+        return problems
+
+    listed = {entry['name'] for entry in manifest['cases']}
+    problems.extend(
+        f"Case '{stem}' is not listed in {MANIFEST_FILE_NAME} and will be compared in full; "
+        'regenerate the manifest with the manifest command.'
+        for stem in sorted((inputs & outputs) - listed)
+    )
+    manifest_signature = _stat_signature(case_dir / MANIFEST_FILE_NAME)
+    manifest_mtime = manifest_signature[0] if manifest_signature else 0
+    for entry in manifest['cases']:
+        for kind, suffix in (('input', '.in'), ('output', '.out')):
+            path = case_dir / f"{entry['name']}{suffix}"
+            signature = _stat_signature(path)
+            if signature is None:
+                problems.append(f"Manifest lists '{path.name}' but the file is missing.")
+                continue
+            if verify_digests or (kind == 'output' and signature[0] > manifest_mtime):
+                size, digest = hash_file(path)
+            else:
+                size, digest = signature[1], entry[f'{kind}_digest']
+            if size != entry[f'{kind}_size'] or digest != entry[f'{kind}_digest']:
+                problems.append(f"Case file '{path.name}' does not match {MANIFEST_FILE_NAME} (corrupted or stale).")
+            elif kind == 'output' and trusted_digests is not None:
+                trusted_digests[entry['name']] = (size, digest)
+    return problems
+
+
+def inspect_case_dir(case_dir: Path) -> tuple[list[str], dict[str, tuple[int, str]]]:
+    """Check a cases directory against its manifest and collect trusted digests.
+
+    Parameters
+    ----------
+    case_dir : Path
+        Directory holding `.in` and `.out` files.
+
+    Returns
+    -------
+    tuple[list[str], dict[str, tuple[int, str]]]
+        Problems from :func:`check_case_files` and the expected-output size
+        and digest of every case that can be verified by digest alone.
+    """
+    digests: dict[str, tuple[int, str]] = {}
+    problems = check_case_files(case_dir, load_case_manifest(case_dir), trusted_digests=digests)
+    return problems, digests
+
+
+@_serve_cached(lambda case_dir: (case_dir, case_dir / MANIFEST_FILE_NAME))
 def load_case_pairs(case_dir: Path) -> list[tuple[Path, Path]]:
     """Return ordered (input, expected) case pairs from the cases directory.
 
+    Cases listed in the manifest are returned even when their files are
+    missing, so the run reports them; cases on disk that the manifest does
+    not list are returned too and verified by a full comparison.
+
     Parameters
     ----------
     case_dir : Path
@@ -138,12 +482,14 @@ def load_case_pairs(case_dir: Path) -> list[tuple[Path, Path]]:
     list[tuple[Path, Path]]
         Pairs of input and expected output files.
     """
-    pairs: list[tuple[Path, Path]] = []
-    for input_case in sorted(case_dir.glob('*.in')):
-        expected = input_case.with_suffix('.out')
-        if not expected.is_file():
+    manifest = load_case_manifest(case_dir)
+    listed = {entry['name'] for entry in manifest['cases']} if manifest is not None else set()
+    pairs = []
+    for name in sorted(listed | {input_case.stem for input_case in case_dir.glob('*.in')}):
+        input_case, expected = case_dir / f'{name}.in', case_dir / f'{name}.out'
+        if name not in listed and not expected.is_file():
             raise FileNotFoundError(
-                f"Missing expected output file for test '{input_case.stem}' in {case_dir}",
+                f"Missing expected output file for test '{name}' in {case_dir}",
             )
         pairs.append((input_case, expected))
     if not pairs:
@@ -151,9 +497,187 @@ def load_case_pairs(case_dir: Path) -> list[tuple[Path, Path]]:
     return pairs
 
 
-def run_single_case(binary: Path, input_path: Path, expected_path: Path) -> tuple[bool, str]:
+def read_process_io(pid: int) -> dict[str, int] | None:
+    """Read the I/O accounting counters Linux keeps for a process.
+
+    Parameters
+    ----------
+    pid : int
+        Process to inspect.
+
+    Returns
+    -------
+    dict[str, int] | None
+        ``rchar``, ``wchar``, ``syscr`` and ``syscw`` counters, or ``None``
+        when ``/proc/<pid>/io`` is unavailable.
+    """
+    try:
+        text = Path(f'/proc/{pid}/io').read_text()
+    except OSError:
+        return None
+    counters = {}
+    for line in text.splitlines():
+        key, _, value = line.partition(':')
+        if key in IO_STAT_FIELDS:
+            counters[key] = int(value)
+    return counters if len(counters) == len(IO_STAT_FIELDS) else None
+
+
+def wait_with_io_stats(process: subprocess.Popen[bytes]) -> tuple[int, dict[str, int] | None]:
+    """Wait for a child and sample its I/O counters just before reaping it.
+
+    ``waitid(..., WNOWAIT)`` leaves the exited child as a zombie whose
+    ``/proc/<pid>/io`` still holds its final totals, so no ptrace is needed.
+
+    Parameters
+    ----------
+    process : subprocess.Popen[bytes]
+        Running child process.
+
+    Returns
+    -------
+    tuple[int, dict[str, int] | None]
+        Exit code and the counters from :func:`read_process_io`.
+    """
+    stats = None
+    if hasattr(os, 'waitid'):
+        try:
+            os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+        except ChildProcessError:
+            pass
+        else:
+            stats = read_process_io(process.pid)
+    return process.wait(), stats
+
+
+def format_io_stats(stats: dict[str, int], min_write_bytes: int) -> str:
+    """Describe I/O counters, flagging suspiciously small average writes.
+
+    Parameters
+    ----------
+    stats : dict[str, int]
+        Counters from :func:`read_process_io`.
+    min_write_bytes : int
+        Average write size below which the case is flagged.
+
+    Returns
+    -------
+    str
+        One-line summary.
+    """
+    average_write = stats['wchar'] / stats['syscw'] if stats['syscw'] else 0.0
+    summary = (
+        f"{stats['syscr']} read(s) / {stats['rchar']} B, "
+        f"{stats['syscw']} write(s) / {stats['wchar']} B, "
+        f'{average_write:.0f} B per write'
+    )
+    if stats['syscw'] >= IO_FLAG_MIN_WRITES and average_write < min_write_bytes:
+        summary += f' [SMALL WRITES: below {min_write_bytes} B per write; is stdout being flushed?]'
+    return summary
+
+
+class InputStager:
+    """Control how case inputs sit in memory before a timed run.
+
+    ``cold`` evicts the input from the page cache before every run, ``warm``
+    reads it once beforehand so it is cached, and ``memfd`` copies it once
+    into an anonymous in-memory file that is rewound and reused for every
+    run. ``None`` opens the file as-is. Staging happens in :meth:`open`,
+    before the child is started, so it never counts towards a measurement.
+    Call :meth:`close` (e.g. via :func:`contextlib.closing`) to release memfds.
+
+    Parameters
+    ----------
+    mode : str | None
+        One of :data:`STAGE_MODES`, or ``None`` for no staging.
+    """
+
+    def __init__(self, mode: str | None) -> None:
+        if mode is not None and mode not in STAGE_MODES:
+            raise ValueError(f"Unknown staging mode '{mode}'.")
+        if mode == 'memfd' and not hasattr(os, 'memfd_create'):
+            raise ValueError('memfd staging is not supported on this platform.')
+        if mode == 'cold' and not hasattr(os, 'posix_fadvise'):
+            raise ValueError('cold staging is not supported on this platform.')
+        self.mode = mode
+        self._warmed: set[Path] = set()
+        self._memfds: dict[Path, int] = {}
+
+    def close(self) -> None:
+        """Release any memfds created for staged inputs."""
+        for descriptor in self._memfds.values():
+            os.close(descriptor)
+        self._memfds.clear()
+
+    def prepare(self, input_path: Path) -> None:
+        """Stage the input according to the mode ahead of a run.
+
+        Parameters
+        ----------
+        input_path : Path
+            Test-case input file.
+        """
+        if self.mode == 'memfd' and input_path not in self._memfds:
+            descriptor = os.memfd_create(input_path.name)
+            with input_path.open('rb') as source, os.fdopen(descriptor, 'wb', closefd=False) as target:
+                while chunk := source.read(STREAM_CHUNK_SIZE):
+                    target.write(chunk)
+            self._memfds[input_path] = descriptor
+        elif self.mode == 'warm' and input_path not in self._warmed:
+            with input_path.open('rb') as source:
+                while source.read(STREAM_CHUNK_SIZE):
+                    pass
+            self._warmed.add(input_path)
+        elif self.mode == 'cold':
+            with input_path.open('rb') as source:
+                os.posix_fadvise(source.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+    @contextlib.contextmanager
+    def open(self, input_path: Path) -> Generator[BinaryIO, None, None]:
+        """Stage the input, then yield it as a readable stdin.
+
+        Parameters
+        ----------
+        input_path : Path
+            Test-case input file.
+
+        Yields
+        ------
+        BinaryIO
+            File positioned at the start of the input.
+        """
+        self.prepare(input_path)
+        if self.mode == 'memfd':
+            descriptor = self._memfds[input_path]
+            os.lseek(descriptor, 0, os.SEEK_SET)
+            with os.fdopen(descriptor, 'rb', closefd=False) as staged:
+                yield staged
+            return
+
+        with input_path.open('rb') as input_file:
+            yield input_file
+
+
+def _decode_output(data: bytes) -> str:
+    # Match the decoding `subprocess.run(..., text=True)` applies (locale encoding, universal newlines).
+    return io.TextIOWrapper(io.BytesIO(data)).read()
+
+
+def run_single_case(
+    binary: Path,
+    input_path: Path,
+    expected_path: Path,
+    *,
+    expected_digest: tuple[int, str] | None = None,
+    io_stats: dict[str, int] | None = None,
+    stager: InputStager | None = None,
+    durations: list[float] | None = None,
+) -> tuple[bool, str]:
     """Execute the binary with the given input and compare output to expectation.
 
+    Stdout is hashed while it streams; when ``expected_digest`` matches, the
+    expected file is never read. Otherwise the outputs are compared as text.
+
     Parameters
     ----------
     binary : Path
@@ -162,29 +686,63 @@ def run_single_case(binary: Path, input_path: Path, expected_path: Path) -> tupl
         Test-case input file.
     expected_path : Path
         Test-case expected output file.
+    expected_digest : tuple[int, str] | None, optional
+        Manifest size and digest of the expected output.
+    io_stats : dict[str, int] | None, optional
+        Filled with the child's I/O counters when they can be sampled.
+    stager : InputStager | None, optional
+        Controls how the input is staged before the run.
+    durations : list[float] | None, optional
+        Receives the child's wall-clock lifetime in seconds, excluding input
+        staging and the comparison against the expected output.
 
     Returns
     -------
     tuple[bool, str]
         Success flag and textual output (transcript or error details).
     """
-    with input_path.open('rb') as input_file:
-        execution = subprocess.run(
+    for path in (input_path, expected_path):
+        if not path.is_file():
+            return False, f"Case file '{path.name}' is missing."
+
+    chunks: list[bytes] = []
+    size = 0
+    hasher = hashlib.blake2b(digest_size=MANIFEST_DIGEST_SIZE) if expected_digest is not None else None
+    stager = stager or InputStager(None)
+    with stager.open(input_path) as input_file, tempfile.TemporaryFile() as error_file:
+        started = time.perf_counter()
+        process = subprocess.Popen(
             [str(binary)],
-            check=False,
             stdin=input_file,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=error_file,
         )
-    if execution.returncode != 0:
+        with process.stdout:
+            while chunk := process.stdout.read(STREAM_CHUNK_SIZE):
+                if hasher is not None:
+                    hasher.update(chunk)
+                chunks.append(chunk)
+                size += len(chunk)
+        returncode, counters = wait_with_io_stats(process)
+        if durations is not None:
+            durations.append(time.perf_counter() - started)
+        if io_stats is not None and counters is not None:
+            io_stats.update(counters)
+        error_file.seek(0)
+        stderr_bytes = error_file.read()
+
+    if returncode != 0:
         failure = (
-            f"Runtime error (exit code {execution.returncode}) for '{input_path.name}'\n"
-            f'stdout:\n{execution.stdout}\n'
-            f'stderr:\n{execution.stderr}'
+            f"Runtime error (exit code {returncode}) for '{input_path.name}'\n"
+            f'stdout:\n{_decode_output(b"".join(chunks))}\n'
+            f'stderr:\n{_decode_output(stderr_bytes)}'
         )
         return False, failure
 
-    actual_text = execution.stdout
+    if hasher is not None and (size, hasher.hexdigest()) == expected_digest:
+        return True, ''
+
+    actual_text = _decode_output(b''.join(chunks))
     expected_text = expected_path.read_text()
     if actual_text == expected_text:
         return True, ''
@@ -204,6 +762,55 @@ def run_single_case(binary: Path, input_path: Path, expected_path: Path) -> tupl
     return False, failure
 
 
+def record_case_result(
+    results: list[dict[str, Any]] | None,
+    project_name: str,
+    case_name: str | None,
+    success: bool,
+    duration: float,
+    message: str,
+    *,
+    io_stats: dict[str, int] | None = None,
+    stage: str | None = None,
+) -> None:
+    """Append a per-case outcome to the optional results collector.
+
+    Parameters
+    ----------
+    results : list[dict[str, Any]] | None
+        Collector to append to; nothing is recorded when ``None``.
+    project_name : str
+        Project the case belongs to.
+    case_name : str | None
+        Case identifier, or ``None`` for project-level failures.
+    success : bool
+        Whether the case passed.
+    duration : float
+        Wall-clock seconds spent executing the case.
+    message : str
+        Failure details (empty on success).
+    io_stats : dict[str, int] | None, optional
+        I/O counters sampled from the case's process.
+    stage : str | None, optional
+        Input staging mode the duration was measured under.
+    """
+    if results is None:
+        return
+    record = {
+        'project': project_name,
+        'case': case_name,
+        'passed': success,
+        'duration': round(duration, 6),
+        'message': '' if success else message,
+    }
+    if io_stats:
+        record['io'] = io_stats
+    if stage is not None:
+        record['stage'] = stage
+    results.append(record)
+
+
+@_serve_cached(lambda cases_file: (cases_file,))
 def load_interactive_cases(cases_file: Path) -> list[dict[str, Any]]:
     """Load interactive case definitions in declaration order.
 
@@ -281,11 +888,70 @@ def run_interactive_case(
     return False, failure
 
 
+def check_interactive_config(project_dir: Path, config: dict[str, Any]) -> str | None:
+    """Validate the keys and referenced files of an interactive configuration.
+
+    Parameters
+    ----------
+    project_dir : Path
+        Directory containing the interactive project.
+    config : dict[str, Any]
+        Parsed configuration dictionary for the project.
+
+    Returns
+    -------
+    str | None
+        Description of the first problem found, or ``None`` when valid.
+    """
+    missing = [
+        key
+        for key in ('runner', 'cases_file', 'judge_source')
+        if not config.get(key)
+    ]
+    if missing:
+        return f"Interactive config for '{project_dir.name}' missing keys: {', '.join(missing)}."
+
+    if not (project_dir / config['runner']).is_file():
+        return f"Runner script '{config['runner']}' not found for project '{project_dir.name}'."
+
+    if not (project_dir / config['cases_file']).is_file():
+        return f"Cases file '{config['cases_file']}' not found for project '{project_dir.name}'."
+
+    if not (project_dir / config['judge_source']).is_file():
+        return f"Judge source '{config['judge_source']}' not found for project '{project_dir.name}'."
+    return None
+
+
+def parse_interactive_timeout(project_dir: Path, config: dict[str, Any]) -> float | None:
+    """Return the configured per-round timeout of an interactive project.
+
+    Parameters
+    ----------
+    project_dir : Path
+        Directory containing the interactive project.
+    config : dict[str, Any]
+        Parsed configuration dictionary for the project.
+
+    Returns
+    -------
+    float | None
+        Timeout in seconds, or ``None`` when not configured.
+    """
+    if 'timeout_seconds' not in config:
+        return None
+    try:
+        return float(config['timeout_seconds'])
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid 'timeout_seconds' value in config for '{project_dir.name}'.") from None
+
+
 def test_interactive_project(
     project_dir: Path,
     config: dict[str, Any],
     *,
     case_name: str | None = None,
+    case_names: Collection[str] | None = None,
+    results: list[dict[str, Any]] | None = None,
 ) -> tuple[bool, list[str]]:
     """Run interactive tests defined by the project configuration.
 
@@ -295,40 +961,25 @@ def test_interactive_project(
         Directory containing the interactive project.
     config : dict[str, Any]
         Parsed configuration dictionary for the project.
+    case_name : str | None, optional
+        Single case to run instead of the full list.
+    case_names : Collection[str] | None, optional
+        Subset of case names to run (used for sharding).
+    results : list[dict[str, Any]] | None, optional
+        Collector receiving one record per executed case.
 
     Returns
     -------
     tuple[bool, list[str]]
         Success flag and any collected error messages.
     """
-    missing = [
-        key
-        for key in ('runner', 'cases_file', 'judge_source')
-        if not config.get(key)
-    ]
-    if missing:
-        return False, [
-            f"Interactive config for '{project_dir.name}' missing keys: {', '.join(missing)}.",
-        ]
+    problem = check_interactive_config(project_dir, config)
+    if problem is not None:
+        return False, [problem]
 
     runner_path = project_dir / config['runner']
-    if not runner_path.is_file():
-        return False, [
-            f"Runner script '{config['runner']}' not found for project '{project_dir.name}'.",
-        ]
-
     cases_path = project_dir / config['cases_file']
-    if not cases_path.is_file():
-        return False, [
-            f"Cases file '{config['cases_file']}' not found for project '{project_dir.name}'.",
-        ]
-
     judge_source = config['judge_source']
-    judge_source_path = project_dir / judge_source
-    if not judge_source_path.is_file():
-        return False, [
-            f"Judge source '{judge_source}' not found for project '{project_dir.name}'.",
-        ]
 
     try:
         solution_binary = compile_project(project_dir)
@@ -348,14 +999,10 @@ def test_interactive_project(
     if not cases:
         return False, [f"No interactive cases defined in '{cases_path}'."]
 
-    timeout_value = None
-    if 'timeout_seconds' in config:
-        try:
-            timeout_value = float(config['timeout_seconds'])
-        except (TypeError, ValueError):
-            return False, [
-                f"Invalid 'timeout_seconds' value in config for '{project_dir.name}'.",
-            ]
+    try:
+        timeout_value = parse_interactive_timeout(project_dir, config)
+    except ValueError as error:
+        return False, [str(error)]
 
     filtered_cases = cases
     if case_name is not None:
@@ -364,11 +1011,14 @@ def test_interactive_project(
             return False, [
                 f"Interactive case '{case_name}' not found for project '{project_dir.name}'.",
             ]
+    if case_names is not None:
+        filtered_cases = [entry for entry in filtered_cases if entry.get('name') in case_names]
 
     for entry in filtered_cases:
         entry_name = entry.get('name')
         if not entry_name:
             return False, ['Encountered interactive case entry without a name.']
+        started = time.perf_counter()
         success, message = run_interactive_case(
             runner_path,
             cases_path,
@@ -377,6 +1027,7 @@ def test_interactive_project(
             solution_binary,
             timeout=timeout_value,
         )
+        record_case_result(results, project_dir.name, entry_name, success, time.perf_counter() - started, message)
         if success:
             print(f'{project_dir.name}: {entry_name} passed.')
             continue
@@ -385,13 +1036,32 @@ def test_interactive_project(
     return True, []
 
 
-def test_project(project_name: str, *, case_name: str | None = None) -> tuple[bool, list[str]]:
+def test_project(
+    project_name: str,
+    *,
+    case_name: str | None = None,
+    case_names: Collection[str] | None = None,
+    results: list[dict[str, Any]] | None = None,
+    min_write_bytes: int | None = None,
+    stage: str | None = None,
+) -> tuple[bool, list[str]]:
     """Compile the project and run all cases, collecting any failures.
 
     Parameters
     ----------
     project_name : str
         Name of the project directory to test.
+    case_name : str | None, optional
+        Single case to run instead of the full suite.
+    case_names : Collection[str] | None, optional
+        Subset of case stems to run (used for sharding).
+    results : list[dict[str, Any]] | None, optional
+        Collector receiving one record per executed case.
+    min_write_bytes : int | None, optional
+        When set, print each case's I/O counters and flag average writes
+        smaller than this many bytes.
+    stage : str | None, optional
+        Input staging mode (see :class:`InputStager`) applied to every case.
 
     Returns
     -------
@@ -404,7 +1074,13 @@ def test_project(project_name: str, *, case_name: str | None = None) -> tuple[bo
 
     config = load_project_config(project_dir)
     if config and config.get('type') == 'interactive':
-        return test_interactive_project(project_dir, config, case_name=case_name)
+        return test_interactive_project(
+            project_dir,
+            config,
+            case_name=case_name,
+            case_names=case_names,
+            results=results,
+        )
 
     case_dir = find_case_dir(project_dir)
     if case_dir is None:
@@ -412,6 +1088,13 @@ def test_project(project_name: str, *, case_name: str | None = None) -> tuple[bo
             f"No '{CASE_DIR_NAME}' directory found for project '{project_name}'.",
         ]
 
+    try:
+        problems, digests = inspect_case_dir(case_dir)
+    except (OSError, ValueError) as error:
+        return False, [f'Failed to load {MANIFEST_FILE_NAME}: {error}']
+    for problem in problems:
+        print(f'{project_name}: warning: {problem}')
+
     try:
         binary = compile_project(project_dir)
     except RuntimeError as error:
@@ -430,32 +1113,1381 @@ def test_project(project_name: str, *, case_name: str | None = None) -> tuple[bo
             return False, [
                 f"Case '{case_name}' not found for project '{project_name}'.",
             ]
-
-    for input_path, expected_path in case_pairs:
-        success, message = run_single_case(binary, input_path, expected_path)
-        if success:
-            print(f'{project_name}: {input_path.name} passed.')
-            continue
-        return False, [message]
+    if case_names is not None:
+        case_pairs = [pair for pair in case_pairs if pair[0].stem in case_names]
+
+    with contextlib.closing(InputStager(stage)) as stager:
+        for input_path, expected_path in case_pairs:
+            io_stats: dict[str, int] = {}
+            durations: list[float] = []
+            success, message = run_single_case(
+                binary,
+                input_path,
+                expected_path,
+                expected_digest=digests.get(input_path.stem),
+                io_stats=io_stats,
+                stager=stager,
+                durations=durations,
+            )
+            duration = durations[0] if durations else 0.0
+            record_case_result(
+                results,
+                project_name,
+                input_path.stem,
+                success,
+                duration,
+                message,
+                io_stats=io_stats,
+                stage=stage,
+            )
+            if min_write_bytes is not None and io_stats:
+                print(f'{project_name}: {input_path.name} I/O: {format_io_stats(io_stats, min_write_bytes)}')
+            if success:
+                timing = '' if stage is None else f' ({duration * 1000:.2f} ms, stage {stage})'
+                print(f'{project_name}: {input_path.name} passed{timing}.')
+                continue
+            return False, [message]
 
     return True, []
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Create the CLI argument parser.
+def list_work_items(project_names: list[str]) -> list[WorkItem]:
+    """Enumerate every (project, case) pair without compiling anything.
+
+    A project whose cases cannot be discovered (unknown name, missing cases
+    directory, broken interactive configuration) yields a single
+    ``(project, None)`` item so that running it still reports the problem.
+
+    Parameters
+    ----------
+    project_names : list[str]
+        Projects whose cases should be listed.
 
     Returns
     -------
-    argparse.ArgumentParser
-        Configured argument parser instance.
+    list[WorkItem]
+        Work items in project order, then case order.
     """
-    parser = argparse.ArgumentParser(
-        description=f"Compile and run C projects against their test cases in '{CASE_DIR_NAME}'.",
-    )
-    parser.add_argument(
-        'projects',
-        nargs='*',
-        help='One or more project directories located at the repository root.',
+    items: list[WorkItem] = []
+    for project_name in project_names:
+        project_dir = ROOT / project_name
+        try:
+            case_names = _list_case_names(project_dir)
+        except (OSError, ValueError, TypeError):
+            case_names = []
+        items.extend((project_name, case_name) for case_name in case_names)
+        if not case_names:
+            items.append((project_name, None))
+    return items
+
+
+def _list_case_names(project_dir: Path) -> list[str]:
+    if not project_dir.is_dir():
+        return []
+    config = load_project_config(project_dir)
+    if config and config.get('type') == 'interactive':
+        cases_path = project_dir / config.get('cases_file', '')
+        if not cases_path.is_file():
+            return []
+        return [entry['name'] for entry in load_interactive_cases(cases_path) if entry.get('name')]
+
+    case_dir = find_case_dir(project_dir)
+    if case_dir is None:
+        return []
+    return [input_path.stem for input_path, _ in load_case_pairs(case_dir)]
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse a ``I/N`` shard specification (1-based index).
+
+    Parameters
+    ----------
+    value : str
+        Raw command-line value.
+
+    Returns
+    -------
+    tuple[int, int]
+        Shard index and total shard count.
+    """
+    index_text, _, count_text = value.partition('/')
+    try:
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}'; expected I/N, e.g. 1/4.") from None
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}'; index must be between 1 and {max(count, 1)}.")
+    return index, count
+
+
+def load_case_timings(report_path: Path) -> dict[tuple[str, str], float]:
+    """Read per-case durations from a previous results report.
+
+    Parameters
+    ----------
+    report_path : Path
+        JSON report written by ``--report`` or the ``merge`` command.
+
+    Returns
+    -------
+    dict[tuple[str, str], float]
+        Recorded duration keyed by (project, case).
+    """
+    with report_path.open('r', encoding='utf-8') as handle:
+        data = json.load(handle)
+    return {
+        (entry['project'], entry['case']): float(entry['duration'])
+        for entry in data.get('results', [])
+        if entry.get('case') is not None
+    }
+
+
+def _stable_bucket(item: tuple[str, str], shard_count: int) -> int:
+    digest = hashlib.blake2b(f'{item[0]}/{item[1]}'.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % shard_count
+
+
+def partition_work_items(
+    items: list[WorkItem],
+    shard_count: int,
+    timings: dict[tuple[str, str], float] | None = None,
+) -> list[list[WorkItem]]:
+    """Split work items into ``shard_count`` deterministic partitions.
+
+    Without timings each item is placed by a stable hash of its name. With
+    timings, items are assigned longest-first to the least-loaded shard so
+    that every shard carries a similar expected runtime; items lacking a
+    recorded duration are estimated from their project's mean (or the global
+    mean). Project-level ``(project, None)`` items always go to the first
+    shard so a broken project fails exactly one shard.
+
+    Parameters
+    ----------
+    items : list[WorkItem]
+        Work items to distribute.
+    shard_count : int
+        Number of shards.
+    timings : dict[tuple[str, str], float] | None, optional
+        Recorded per-case durations.
+
+    Returns
+    -------
+    list[list[WorkItem]]
+        Work items for each shard, preserving the input order within a shard.
+    """
+    shards: list[list[WorkItem]] = [[] for _ in range(shard_count)]
+    case_items = [(project_name, case_name) for project_name, case_name in items if case_name is not None]
+    if not timings:
+        assignment = {item: _stable_bucket(item, shard_count) for item in case_items}
+    else:
+        assignment = _balance_by_timings(case_items, shard_count, timings)
+    for item in items:
+        shards[0 if item[1] is None else assignment[item]].append(item)
+    return shards
+
+
+def _balance_by_timings(
+    items: list[tuple[str, str]],
+    shard_count: int,
+    timings: dict[tuple[str, str], float],
+) -> dict[tuple[str, str], int]:
+
+    per_project: dict[str, list[float]] = {}
+    for (project_name, _), duration in timings.items():
+        per_project.setdefault(project_name, []).append(duration)
+    global_mean = sum(timings.values()) / len(timings)
+
+    def expected(item: tuple[str, str]) -> float:
+        if item in timings:
+            return timings[item]
+        known = per_project.get(item[0])
+        return sum(known) / len(known) if known else global_mean
+
+    loads = [0.0] * shard_count
+    assignment: dict[tuple[str, str], int] = {}
+    for item in sorted(items, key=lambda entry: (-expected(entry), entry)):
+        target = min(range(shard_count), key=lambda shard: (loads[shard], shard))
+        loads[target] += expected(item)
+        assignment[item] = target
+    return assignment
+
+
+def write_report(report_path: Path, results: list[dict[str, Any]], *, shard: str | None = None) -> None:
+    """Write per-case results as a JSON report.
+
+    Parameters
+    ----------
+    report_path : Path
+        Destination file.
+    results : list[dict[str, Any]]
+        Records produced by :func:`record_case_result`.
+    shard : str | None, optional
+        Shard specification the results belong to.
+    """
+    payload = {
+        'shard': shard,
+        'passed': all(entry['passed'] for entry in results),
+        'results': results,
+    }
+    with report_path.open('w', encoding='utf-8') as handle:
+        json.dump(payload, handle, indent=2)
+        handle.write('\n')
+
+
+def build_merge_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for the ``merge`` command.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Configured argument parser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog='test_projects.py merge',
+        description='Combine shard reports into a single report and exit code.',
+    )
+    parser.add_argument('reports', nargs='+', type=Path, help='Shard reports written with --report.')
+    parser.add_argument('-o', '--output', type=Path, help='Write the merged report to this file.')
+    return parser
+
+
+def shard_coverage_problem(shards: list[str | None]) -> str | None:
+    """Check that report shard specifications cover ``1..N`` exactly once.
+
+    Parameters
+    ----------
+    shards : list[str | None]
+        ``I/N`` specification of each report; ``None`` stands for an
+        unsharded run, i.e. ``1/1``.
+
+    Returns
+    -------
+    str | None
+        Description of the inconsistency, if any.
+    """
+    parsed: list[tuple[int, int]] = []
+    for shard in shards:
+        try:
+            parsed.append((1, 1) if shard is None else parse_shard(shard))
+        except argparse.ArgumentTypeError as error:
+            return str(error)
+    counts = sorted({count for _, count in parsed})
+    if len(counts) > 1:
+        return f"Reports come from different shard counts: {', '.join(map(str, counts))}."
+    indices = [index for index, _ in parsed]
+    duplicates = sorted({index for index in indices if indices.count(index) > 1})
+    if duplicates:
+        return f"Shard(s) {', '.join(f'{index}/{counts[0]}' for index in duplicates)} reported more than once."
+    missing = sorted(set(range(1, counts[0] + 1)) - set(indices))
+    if missing:
+        return f"Missing report(s) for shard(s) {', '.join(f'{index}/{counts[0]}' for index in missing)}."
+    return None
+
+
+def merge_main(argv: list[str]) -> int:
+    """Merge shard reports and return the combined exit status.
+
+    The reports must agree on the shard count and cover every shard exactly
+    once; otherwise nothing is merged and the exit status is 1.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments following the ``merge`` command.
+
+    Returns
+    -------
+    int
+        Shell-style success (0) or failure exit code.
+    """
+    args = build_merge_parser().parse_args(argv)
+
+    reports: list[dict[str, Any]] = []
+    for report_path in args.reports:
+        try:
+            with report_path.open('r', encoding='utf-8') as handle:
+                data = json.load(handle)
+        except (OSError, ValueError) as error:
+            print(f"Failed to read report '{report_path}': {error}", file=sys.stderr)
+            return 1
+        if not isinstance(data, dict):
+            print(f"Failed to read report '{report_path}': expected a JSON object.", file=sys.stderr)
+            return 1
+        reports.append(data)
+    problem = shard_coverage_problem([data.get('shard') for data in reports])
+    if problem is not None:
+        print(f'Cannot merge reports: {problem}', file=sys.stderr)
+        return 1
+
+    merged: list[dict[str, Any]] = []
+    project_errors: set[tuple[str, str]] = set()
+    for data in reports:
+        for entry in data.get('results', []):
+            if entry['case'] is None:
+                # Every shard touching a broken project reports the same build error.
+                key = (entry['project'], entry['message'])
+                if key in project_errors:
+                    continue
+                project_errors.add(key)
+            merged.append(entry)
+    merged.sort(key=lambda entry: (entry['project'], entry['case'] or ''))
+
+    if args.output:
+        write_report(args.output, merged)
+
+    failures = [entry for entry in merged if not entry['passed']]
+    passed = len(merged) - len(failures)
+    print(f'Merged {len(args.reports)} report(s): {passed} passed, {len(failures)} failed.')
+    for entry in failures:
+        label = entry['project'] if entry['case'] is None else f"{entry['project']}/{entry['case']}"
+        print(f'== {label} ==')
+        print(entry['message'])
+
+    if not failures:
+        print('All requested projects passed their test suites.')
+        return 0
+
+    print('At least one project failed.')
+    return 2
+
+
+def build_manifest_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for the ``manifest`` command.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Configured argument parser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog='test_projects.py manifest',
+        description=f"Write or verify each project's '{CASE_DIR_NAME}/{MANIFEST_FILE_NAME}'.",
+    )
+    parser.add_argument('projects', nargs='*', help='Projects whose manifests should be processed.')
+    parser.add_argument('-a', '--all', action='store_true', help='Process every available project.')
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Verify existing manifests against the case files instead of rewriting them.',
+    )
+    return parser
+
+
+def manifest_main(argv: list[str]) -> int:
+    """Generate or verify case manifests and return the exit status.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments following the ``manifest`` command.
+
+    Returns
+    -------
+    int
+        Shell-style success (0) or failure exit code.
+    """
+    parser = build_manifest_parser()
+    args = parser.parse_args(argv)
+    selected = list_projects() if args.all else args.projects
+    if not selected:
+        parser.error('specify at least one project or use --all')
+
+    overall_success = True
+    for project in selected:
+        project_dir = ROOT / project
+        config = load_project_config(project_dir)
+        if config and config.get('type') == 'interactive':
+            print(f'{project}: interactive project, no manifest needed.')
+            continue
+        case_dir = find_case_dir(project_dir)
+        if case_dir is None:
+            print(f"No '{CASE_DIR_NAME}' directory found for project '{project}'.")
+            overall_success = False
+            continue
+
+        if args.check:
+            try:
+                manifest = load_case_manifest(case_dir)
+            except (OSError, ValueError) as error:
+                manifest, problems = None, [f'Failed to load {MANIFEST_FILE_NAME}: {error}']
+            else:
+                problems = [] if manifest else [f'No {MANIFEST_FILE_NAME} found.']
+            if manifest is not None:
+                problems = check_case_files(case_dir, manifest, verify_digests=True)
+            for problem in problems:
+                print(f'{project}: {problem}')
+            if problems:
+                overall_success = False
+            else:
+                print(f'{project}: manifest OK.')
+            continue
+
+        for problem in check_case_files(case_dir, None):
+            print(f'{project}: warning: {problem}')
+        manifest = build_case_manifest(case_dir)
+        with (case_dir / MANIFEST_FILE_NAME).open('w', encoding='utf-8') as handle:
+            json.dump(manifest, handle, indent=2)
+            handle.write('\n')
+        print(f"{project}: wrote {len(manifest['cases'])} case(s) to {MANIFEST_FILE_NAME}.")
+
+    return 0 if overall_success else 2
+
+
+def resolve_base_source(project_dir: Path, base: str) -> Path:
+    """Return a source file for the A/B baseline, extracting it from git if needed.
+
+    Parameters
+    ----------
+    project_dir : Path
+        Directory containing the project sources.
+    base : str
+        Path to a C file, or a git revision whose ``<project>/main.c`` is used.
+
+    Returns
+    -------
+    Path
+        Filesystem path to the baseline source.
+    """
+    candidate = Path(base)
+    if candidate.is_file():
+        return candidate.resolve()
+
+    revision_path = f'{project_dir.name}/{DEFAULT_SOURCE_NAME}'
+    result = subprocess.run(
+        ['git', 'show', f'{base}:{revision_path}'],
+        check=False,
+        capture_output=True,
+        cwd=ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"'{base}' is neither a file nor a git revision containing '{revision_path}'.\n"
+            f'{result.stderr.decode(errors="replace")}',
+        )
+    build_dir = project_dir / DEFAULT_BUILD_DIR_NAME
+    build_dir.mkdir(exist_ok=True)
+    source_path = build_dir / f'{project_dir.name}_base.c'
+    source_path.write_bytes(result.stdout)
+    return source_path
+
+
+def capture_case_output(binary: Path, input_path: Path, *, timeout: float | None = None) -> tuple[int, bytes]:
+    """Run the binary on a case input and return its exit code and stdout.
+
+    Parameters
+    ----------
+    binary : Path
+        Compiled program to execute.
+    input_path : Path
+        Test-case input file.
+    timeout : float | None, optional
+        Seconds after which the run is killed and ``TimeoutExpired`` raised.
+
+    Returns
+    -------
+    tuple[int, bytes]
+        Exit code and raw standard output.
+    """
+    with input_path.open('rb') as input_file:
+        execution = subprocess.run(
+            [str(binary)],
+            check=False,
+            stdin=input_file,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+        )
+    return execution.returncode, execution.stdout
+
+
+def time_case_run(
+    binary: Path,
+    input_path: Path,
+    stager: InputStager | None = None,
+    *,
+    timeout: float | None = None,
+) -> float:
+    """Return the wall-clock seconds one run of the binary takes on a case.
+
+    Parameters
+    ----------
+    binary : Path
+        Compiled program to execute.
+    input_path : Path
+        Test-case input file.
+    stager : InputStager | None, optional
+        Controls how the input is staged; staging happens before the clock starts.
+    timeout : float | None, optional
+        Seconds after which the run is killed and ``TimeoutExpired`` raised.
+
+    Returns
+    -------
+    float
+        Elapsed seconds.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If the run exits with a non-zero status, so it is not used as a sample.
+    """
+    stager = stager or InputStager(None)
+    with stager.open(input_path) as input_file:
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [str(binary)],
+            check=False,
+            stdin=input_file,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+        )
+        elapsed = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise subprocess.CalledProcessError(completed.returncode, completed.args)
+    return elapsed
+
+
+def benchmark_case(
+    base_binary: Path,
+    candidate_binary: Path,
+    input_path: Path,
+    repetitions: int,
+    stager: InputStager,
+    timeout: float,
+) -> tuple[list[float], list[float]]:
+    """Time both binaries on one case, alternating which one runs first.
+
+    Even repetitions run base then candidate and odd ones the reverse, so a
+    systematic first/second-run effect cancels out.
+
+    Parameters
+    ----------
+    base_binary : Path
+        Baseline program.
+    candidate_binary : Path
+        Candidate program.
+    input_path : Path
+        Test-case input file.
+    repetitions : int
+        Number of base/candidate pairs.
+    stager : InputStager
+        Input staging shared by both binaries.
+    timeout : float
+        Per-run timeout in seconds.
+
+    Returns
+    -------
+    tuple[list[float], list[float]]
+        Paired base and candidate durations.
+    """
+    base_times: list[float] = []
+    candidate_times: list[float] = []
+    for repetition in range(repetitions):
+        runs = [(base_binary, base_times), (candidate_binary, candidate_times)]
+        for binary, times in runs if repetition % 2 == 0 else reversed(runs):
+            times.append(time_case_run(binary, input_path, stager, timeout=timeout))
+    return base_times, candidate_times
+
+
+def summarize_speedup(base_times: list[float], candidate_times: list[float]) -> tuple[float, float, float]:
+    """Estimate the speedup of paired runs with a 95% confidence interval.
+
+    Each ABAB repetition yields one ``base / candidate`` ratio; the interval
+    is a Student's t interval on the log ratios, so it is symmetric in
+    relative terms.
+
+    Parameters
+    ----------
+    base_times : list[float]
+        Baseline durations, one per repetition.
+    candidate_times : list[float]
+        Candidate durations paired with ``base_times``.
+
+    Returns
+    -------
+    tuple[float, float, float]
+        Geometric-mean speedup and the lower/upper interval bounds.
+
+    Raises
+    ------
+    ValueError
+        If fewer than :data:`MIN_CONFIDENCE_SAMPLES` pairs are given.
+    """
+    log_ratios = [
+        math.log(max(base, 1e-9) / max(candidate, 1e-9))
+        for base, candidate in zip(base_times, candidate_times)
+    ]
+    if len(log_ratios) < MIN_CONFIDENCE_SAMPLES:
+        raise ValueError(f'A confidence interval needs at least {MIN_CONFIDENCE_SAMPLES} paired samples.')
+    centre = statistics.fmean(log_ratios)
+    degrees = len(log_ratios) - 1
+    critical = T_CRITICAL_95[degrees - 1] if degrees <= len(T_CRITICAL_95) else 1.96
+    margin = critical * statistics.stdev(log_ratios) / math.sqrt(len(log_ratios))
+    return math.exp(centre), math.exp(centre - margin), math.exp(centre + margin)
+
+
+def add_stage_argument(parser: argparse.ArgumentParser) -> None:
+    """Register the shared ``--stage`` option on a parser.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        Parser to extend.
+    """
+    parser.add_argument(
+        '--stage',
+        choices=STAGE_MODES,
+        help=(
+            'Stage case inputs before timing: cold evicts them from the page cache, warm pre-reads them, '
+            'memfd serves them from an in-memory copy.'
+        ),
+    )
+
+
+def build_ab_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for the ``ab`` command.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Configured argument parser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog='test_projects.py ab',
+        description="Benchmark two versions of a project's source against each other on its cases.",
+    )
+    parser.add_argument('project', help='Project directory to benchmark.')
+    parser.add_argument('--base', required=True, help='Baseline C file, or git revision of the project source.')
+    parser.add_argument(
+        '--candidate',
+        type=Path,
+        help=f"Candidate C file (default: the working tree's {DEFAULT_SOURCE_NAME}).",
+    )
+    parser.add_argument(
+        '-n',
+        '--repetitions',
+        type=int,
+        default=10,
+        help='Interleaved base/candidate run pairs per case (default: 10).',
+    )
+    parser.add_argument('--case', help='Benchmark only the specified case.')
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=DEFAULT_AB_TIMEOUT,
+        help=f'Seconds before a single run is abandoned (default: {DEFAULT_AB_TIMEOUT:g}).',
+    )
+    add_stage_argument(parser)
+    return parser
+
+
+def ab_main(argv: list[str]) -> int:
+    """Compile two source versions, check they agree, and compare their speed.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments following the ``ab`` command.
+
+    Returns
+    -------
+    int
+        Shell-style success (0) or failure exit code.
+    """
+    parser = build_ab_parser()
+    args = parser.parse_args(argv)
+    if args.repetitions < MIN_CONFIDENCE_SAMPLES:
+        parser.error(f'--repetitions must be at least {MIN_CONFIDENCE_SAMPLES}')
+    if args.timeout <= 0:
+        parser.error('--timeout must be positive')
+    try:
+        InputStager(args.stage)
+    except ValueError as error:
+        parser.error(str(error))
+
+    project_dir = ROOT / args.project
+    if not project_dir.is_dir():
+        print(f"Project '{args.project}' not found.", file=sys.stderr)
+        return 1
+    config = load_project_config(project_dir)
+    if config and config.get('type') == 'interactive':
+        print(f"A/B benchmarking is not supported for interactive project '{args.project}'.", file=sys.stderr)
+        return 1
+    case_dir = find_case_dir(project_dir)
+    if case_dir is None:
+        print(f"No '{CASE_DIR_NAME}' directory found for project '{args.project}'.", file=sys.stderr)
+        return 1
+
+    candidate_source = args.candidate.resolve() if args.candidate else project_dir / DEFAULT_SOURCE_NAME
+    try:
+        base_source = resolve_base_source(project_dir, args.base)
+        base_binary = compile_source(project_dir, str(base_source), f'{args.project}_base')
+        candidate_binary = compile_source(project_dir, str(candidate_source), f'{args.project}_candidate')
+        case_pairs = load_case_pairs(case_dir)
+    except (RuntimeError, OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    if args.case is not None:
+        case_pairs = [pair for pair in case_pairs if args.case in {pair[0].stem, pair[0].name}]
+        if not case_pairs:
+            print(f"Case '{args.case}' not found for project '{args.project}'.", file=sys.stderr)
+            return 1
+
+    # The agreement check doubles as a warm-up run for both binaries.
+    for input_path, _ in case_pairs:
+        try:
+            base_output = capture_case_output(base_binary, input_path, timeout=args.timeout)
+            candidate_output = capture_case_output(candidate_binary, input_path, timeout=args.timeout)
+        except subprocess.TimeoutExpired as error:
+            print(f"'{error.cmd[0]}' exceeded {args.timeout:g}s on '{input_path.name}'; not benchmarking.")
+            return 2
+        if base_output != candidate_output:
+            print(
+                f"Outputs differ for '{input_path.name}' "
+                f'(base exit {base_output[0]}, candidate exit {candidate_output[0]}); not benchmarking.',
+            )
+            return 2
+
+    print(f'== A/B benchmark: {args.project} ({args.repetitions} interleaved repetitions) ==')
+    print(f'base:      {base_source}')
+    print(f'candidate: {candidate_source}')
+    print(f"staging:   {args.stage or 'none'}")
+    log_speedups: list[float] = []
+    with contextlib.closing(InputStager(args.stage)) as stager:
+        for input_path, _ in case_pairs:
+            try:
+                base_times, candidate_times = benchmark_case(
+                    base_binary,
+                    candidate_binary,
+                    input_path,
+                    args.repetitions,
+                    stager,
+                    args.timeout,
+                )
+            except subprocess.TimeoutExpired as error:
+                print(f"'{error.cmd[0]}' exceeded {args.timeout:g}s on '{input_path.name}'; stopping.")
+                return 2
+            except subprocess.CalledProcessError as error:
+                print(f"'{error.cmd[0]}' exited with code {error.returncode} on '{input_path.name}'; stopping.")
+                return 2
+            speedup, lower, upper = summarize_speedup(base_times, candidate_times)
+            log_speedups.append(math.log(speedup))
+            print(
+                f'{input_path.name} [stage {args.stage or "none"}]: '
+                f'base {statistics.median(base_times) * 1000:.2f} ms, '
+                f'candidate {statistics.median(candidate_times) * 1000:.2f} ms, '
+                f'speedup {speedup:.3f}x (95% CI {lower:.3f}x-{upper:.3f}x)',
+            )
+    print(f'Geometric mean speedup over {len(log_speedups)} case(s): {math.exp(statistics.fmean(log_speedups)):.3f}x')
+    return 0
+
+
+def split_case_records(data: bytes) -> tuple[bytes, bool, list[bytes], list[bytes]]:
+    """Split a case input into a fixed header line, records, and trailer.
+
+    The first line is a header that is never removed, since it usually holds
+    sizes the rest of the input depends on. A header holding a single integer
+    equal to the number of following lines (optionally minus one terminating
+    line) is a count header and is regenerated by :func:`join_case_records`.
+    Trailing blank lines are always preserved.
+
+    Parameters
+    ----------
+    data : bytes
+        Raw case input.
+
+    Returns
+    -------
+    tuple[bytes, bool, list[bytes], list[bytes]]
+        Header line (empty for an empty input), whether it is a count header,
+        record lines, and trailer lines.
+    """
+    lines = data.splitlines(keepends=True)
+    trailer: list[bytes] = []
+    while lines and not lines[-1].strip():
+        trailer.insert(0, lines.pop())
+    if not lines:
+        return b'', False, [], trailer
+
+    header, body = lines[0], lines[1:]
+    fields = header.split()
+    if len(fields) == 1 and fields[0].isdigit() and (count := int(fields[0])) in {len(body), len(body) - 1}:
+        return header, True, body[:count], body[count:] + trailer
+    return header, False, body, trailer
+
+
+def join_case_records(header: bytes, counted: bool, records: Sequence[bytes], trailer: Sequence[bytes]) -> bytes:
+    """Reassemble a case input produced by :func:`split_case_records`.
+
+    Parameters
+    ----------
+    header : bytes
+        Header line, kept verbatim unless ``counted``.
+    counted : bool
+        Rewrite the header as ``len(records)``, keeping its line ending.
+    records : Sequence[bytes]
+        Record lines to keep.
+    trailer : Sequence[bytes]
+        Lines appended after the records.
+
+    Returns
+    -------
+    bytes
+        Reassembled case input.
+    """
+    if counted:
+        header = f'{len(records)}'.encode() + (header[len(header.rstrip(b'\r\n')) :] or b'\n')
+    return header + b''.join(records) + b''.join(trailer)
+
+
+def _reference_output(reference: Path, data: bytes, timeout: float) -> bytes | None:
+    try:
+        oracle = subprocess.run(
+            [str(reference)],
+            check=False,
+            input=data,
+            capture_output=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    return oracle.stdout if oracle.returncode == 0 else None
+
+
+def classify_failure(
+    binary: Path,
+    data: bytes,
+    expected: bytes | None,
+    reference: Path | None,
+    timeout: float,
+) -> str | None:
+    """Run the binary on an input and name the failure it exhibits, if any.
+
+    Output is checked against ``expected`` when given, otherwise against the
+    ``reference`` binary's output. When a reference is given, inputs it
+    rejects (non-zero exit or timeout) count as passing for every failure
+    class, so minimization never drifts into malformed input.
+
+    Parameters
+    ----------
+    binary : Path
+        Program under test.
+    data : bytes
+        Case input.
+    expected : bytes | None
+        Known expected output for ``data``.
+    reference : Path | None
+        Trusted implementation validating the input and, when ``expected`` is
+        unknown, supplying the expected output.
+    timeout : float
+        Seconds before a run counts as a timeout.
+
+    Returns
+    -------
+    str | None
+        ``'timeout'``, ``'crash'``, ``'mismatch'``, or ``None`` when the run passes.
+    """
+    failure = None
+    try:
+        execution = subprocess.run(
+            [str(binary)],
+            check=False,
+            input=data,
+            capture_output=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        failure = 'timeout'
+    else:
+        if execution.returncode != 0:
+            failure = 'crash'
+
+    oracle = None
+    if reference is not None:
+        oracle = _reference_output(reference, data, timeout)
+        if oracle is None:
+            return None
+    if failure is not None:
+        return failure
+
+    expected = expected if expected is not None else oracle
+    if expected is None:
+        return None
+    if _decode_output(execution.stdout) != _decode_output(expected):
+        return 'mismatch'
+    return None
+
+
+def minimize_records(
+    records: list[bytes],
+    reproduces: Callable[[list[list[bytes]]], int | None],
+) -> list[bytes]:
+    """Shrink records with delta debugging (ddmin) while the failure persists.
+
+    Parameters
+    ----------
+    records : list[bytes]
+        Records of the failing input.
+    reproduces : Callable[[list[list[bytes]]], int | None]
+        Evaluates a batch of candidate record lists and returns the index of
+        the first one that still fails, or ``None``.
+
+    Returns
+    -------
+    list[bytes]
+        A 1-minimal record list reproducing the failure.
+    """
+    granularity = DDMIN_MIN_GRANULARITY
+    while len(records) >= DDMIN_MIN_GRANULARITY:
+        size = len(records)
+        bounds = [size * index // granularity for index in range(granularity + 1)]
+        chunks = [records[bounds[index] : bounds[index + 1]] for index in range(granularity)]
+        complements = [records[: bounds[index]] + records[bounds[index + 1] :] for index in range(granularity)]
+        # With two chunks each complement is the other chunk, so only test the chunks.
+        candidates = chunks + complements if granularity > DDMIN_MIN_GRANULARITY else chunks
+        found = reproduces(candidates)
+        if found is not None and found < granularity:
+            records, granularity = candidates[found], DDMIN_MIN_GRANULARITY
+        elif found is not None:
+            records, granularity = candidates[found], max(granularity - 1, DDMIN_MIN_GRANULARITY)
+        elif granularity < size:
+            granularity = min(granularity * 2, size)
+        else:
+            break
+    return records
+
+
+def build_minimize_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for the ``minimize`` command.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Configured argument parser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog='test_projects.py minimize',
+        description='Shrink a failing case input while preserving its failure (mismatch, crash, or timeout).',
+    )
+    parser.add_argument('project', help='Project directory containing the case.')
+    parser.add_argument('case', help='Failing case to minimize (e.g. case_09).')
+    parser.add_argument(
+        '--reference',
+        default='HEAD',
+        help='C file or git revision used as the oracle for reduced inputs (default: HEAD).',
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=10.0,
+        help='Seconds before a run is classified as a timeout (default: 10).',
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes evaluating candidates in parallel (default: CPU count).',
+    )
+    return parser
+
+
+def minimize_main(argv: list[str]) -> int:
+    """Minimize a failing case and write the result next to the original.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments following the ``minimize`` command.
+
+    Returns
+    -------
+    int
+        Shell-style success (0) or failure exit code.
+    """
+    parser = build_minimize_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
+    project_dir = ROOT / args.project
+    case_dir = find_case_dir(project_dir) if project_dir.is_dir() else None
+    if case_dir is None:
+        print(f"No '{CASE_DIR_NAME}' directory found for project '{args.project}'.", file=sys.stderr)
+        return 1
+    case_stem = args.case.removesuffix('.in')
+    input_path = case_dir / f'{case_stem}.in'
+    expected_path = case_dir / f'{case_stem}.out'
+    if not input_path.is_file() or not expected_path.is_file():
+        print(f"Case '{args.case}' not found for project '{args.project}'.", file=sys.stderr)
+        return 1
+
+    try:
+        binary = compile_project(project_dir)
+        reference_source = resolve_base_source(project_dir, args.reference)
+        reference = compile_source(project_dir, str(reference_source), f'{args.project}_reference')
+    except RuntimeError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    data = input_path.read_bytes()
+    expected = expected_path.read_bytes()
+    failure = classify_failure(binary, data, expected, None, args.timeout)
+    if failure is None:
+        print(f"'{input_path.name}' passes; nothing to minimize.")
+        return 1
+    oracle: Path | None = reference
+    if classify_failure(reference, data, expected, None, args.timeout) is not None:
+        if failure == 'mismatch':
+            print(f"Reference '{args.reference}' does not pass '{input_path.name}'; it cannot serve as an oracle.")
+            return 1
+        print(
+            f"Warning: reference '{args.reference}' also fails '{input_path.name}'; "
+            'reduced inputs are not validated and may become malformed.',
+        )
+        oracle = None
+
+    header, counted, records, trailer = split_case_records(data)
+    print(f'{input_path.name}: {failure} with {len(records)} record(s); minimizing with {args.jobs} worker(s)...')
+
+    # Spawned rather than forked workers, so minimizing is safe inside the multithreaded daemon.
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=args.jobs,
+        mp_context=multiprocessing.get_context('spawn'),
+    ) as pool:
+
+        def reproduces(candidates: list[list[bytes]]) -> int | None:
+            inputs = [join_case_records(header, counted, candidate, trailer) for candidate in candidates]
+            outcomes = pool.map(
+                classify_failure,
+                [binary] * len(inputs),
+                inputs,
+                [None] * len(inputs),
+                [oracle] * len(inputs),
+                [args.timeout] * len(inputs),
+            )
+            for index, outcome in enumerate(outcomes):
+                if outcome == failure:
+                    return index
+            return None
+
+        records = minimize_records(records, reproduces)
+
+    minimized = join_case_records(header, counted, records, trailer)
+    minimized_input = case_dir / f'{case_stem}.in.min'
+    minimized_input.write_bytes(minimized)
+    print(f'Reduced to {len(records)} record(s) ({len(minimized)} bytes): {minimized_input.relative_to(ROOT)}')
+
+    reference_output = _reference_output(reference, minimized, args.timeout)
+    if reference_output is None:
+        print('Reference failed on the reduced input; no expected output written.')
+    else:
+        minimized_expected = case_dir / f'{case_stem}.out.min'
+        minimized_expected.write_bytes(reference_output)
+        print(f'Reference output: {minimized_expected.relative_to(ROOT)}')
+    return 0
+
+
+class _ClientRoutedStream:
+    """Standard stream that sends each thread's output to its daemon client.
+
+    Threads running a client request have a writer in :data:`_CLIENT_STREAMS`
+    and their writes are relayed to it as JSON lines; all other threads write
+    to the daemon's own stream.
+    """
+
+    def __init__(self, kind: str, fallback: io.TextIOBase) -> None:
+        self._kind = kind
+        self._fallback = fallback
+
+    def write(self, text: str) -> int:
+        """Write text to the current thread's client, or to the daemon's stream.
+
+        Returns
+        -------
+        int
+            Number of characters written.
+        """
+        writer = getattr(_CLIENT_STREAMS, 'writer', None)
+        if writer is None:
+            return self._fallback.write(text)
+        if text:
+            writer.write(json.dumps({self._kind: text}) + '\n')
+            writer.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        """Flush the stream the current thread writes to."""
+        writer = getattr(_CLIENT_STREAMS, 'writer', None)
+        (self._fallback if writer is None else writer).flush()
+
+
+def warm_project(project: str) -> None:
+    """Load a project's configuration and cases and build its binaries.
+
+    Used by ``serve`` to populate the daemon caches before the first request;
+    problems are left for the real run to report.
+
+    Parameters
+    ----------
+    project : str
+        Project directory name.
+    """
+    project_dir = ROOT / project
+    with contextlib.suppress(Exception):
+        config = load_project_config(project_dir)
+        compile_project(project_dir)
+        if config and config.get('type') == 'interactive':
+            load_interactive_cases(project_dir / config['cases_file'])
+            compile_source(project_dir, config['judge_source'], f'{project}_judge')
+        elif (case_dir := find_case_dir(project_dir)) is not None:
+            load_case_manifest(case_dir)
+            load_case_pairs(case_dir)
+
+
+def run_cli_request(argv: list[str]) -> int:
+    """Run the CLI in-process and convert argparse exits to a status code.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Forwarded command-line arguments.
+
+    Returns
+    -------
+    int
+        Shell-style exit code.
+    """
+    if argv and argv[0] in {'serve', 'client'}:
+        print(f"The '{argv[0]}' command cannot be forwarded to the daemon.", file=sys.stderr)
+        return 1
+    try:
+        return main(argv)
+    except SystemExit as exit_request:
+        if exit_request.code is None or isinstance(exit_request.code, int):
+            return exit_request.code or 0
+        print(exit_request.code, file=sys.stderr)
+        return 1
+
+
+def _run_request(request: dict[str, Any], writer: io.TextIOBase, request_lock: threading.Lock) -> None:
+    status = 1
+    _CLIENT_STREAMS.writer = writer
+    try:
+        with request_lock:
+            previous_cwd = Path.cwd()
+            os.chdir(request['cwd'])
+            try:
+                status = run_cli_request(list(request['argv']))
+            finally:
+                os.chdir(previous_cwd)
+    finally:
+        del _CLIENT_STREAMS.writer
+        writer.write(json.dumps({'exit': status}) + '\n')
+        writer.flush()
+
+
+def handle_client(connection: socket.socket, request_lock: threading.Lock) -> None:
+    """Serve one client request, streaming its output back over the socket.
+
+    Requests run one at a time because they change the working directory.
+    Output written by this thread goes to the client; an unexpected exception
+    still reports a failing exit status before propagating.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        Accepted client connection.
+    request_lock : threading.Lock
+        Lock serialising request execution.
+    """
+    with connection, connection.makefile('r', encoding='utf-8') as reader, connection.makefile(
+        'w',
+        encoding='utf-8',
+    ) as writer:
+        try:
+            request = json.loads(reader.readline())
+            _run_request(request, writer, request_lock)
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            print(f'Dropped client request: {error}', file=sys.stderr)
+
+
+def _report_request_error(future: concurrent.futures.Future[None]) -> None:
+    if not future.cancelled() and (error := future.exception()) is not None:
+        traceback.print_exception(error)
+
+
+def _raise_keyboard_interrupt(signum: int, frame: object) -> None:
+    del signum, frame
+    raise KeyboardInterrupt
+
+
+def build_serve_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for the ``serve`` command.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Configured argument parser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog='test_projects.py serve',
+        description='Run a warm daemon that executes forwarded test_projects.py commands.',
+    )
+    parser.add_argument(
+        '--socket',
+        type=Path,
+        default=DEFAULT_SOCKET_PATH,
+        help=f'Unix socket to listen on (default: {DEFAULT_SOCKET_PATH}).',
+    )
+    parser.add_argument(
+        '-j',
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Threads accepting clients and pre-building projects (default: CPU count).',
+    )
+    return parser
+
+
+def serve_main(argv: list[str]) -> int:
+    """Keep binaries, configs and case indexes warm and serve client requests.
+
+    Cached results are reused until the files they came from change; note
+    that a new project is only noticed when the repository root itself is
+    modified.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments following the ``serve`` command.
+
+    Returns
+    -------
+    int
+        Shell-style success (0) or failure exit code.
+    """
+    parser = build_serve_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+
+    try:
+        problem = prepare_socket_dir(DEFAULT_SOCKET_DIR) if args.socket == DEFAULT_SOCKET_PATH else None
+    except OSError as error:
+        problem = str(error)
+    if problem is not None:
+        print(f'Cannot use the socket directory: {problem}', file=sys.stderr)
+        return 1
+    if args.socket.exists():
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(args.socket))
+            except OSError:
+                problem = _remove_stale_socket(args.socket)
+            else:
+                problem = f'A daemon is already listening on {args.socket}.'
+        if problem is not None:
+            print(problem, file=sys.stderr)
+            return 1
+
+    # A daemon started in the background (`serve &`) inherits an ignored SIGINT, so
+    # both signals are routed to KeyboardInterrupt to run the cleanup below.
+    previous_handlers = {
+        signum: signal.signal(signum, handler)
+        for signum, handler in (
+            (signal.SIGINT, signal.default_int_handler),
+            (signal.SIGTERM, _raise_keyboard_interrupt),
+        )
+    }
+    streams = sys.stdout, sys.stderr
+    sys.stdout = _ClientRoutedStream('stdout', sys.stdout)
+    sys.stderr = _ClientRoutedStream('stderr', sys.stderr)
+    _SERVING.set()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        _serve_forever(server, args.socket, args.workers)
+    except KeyboardInterrupt:
+        print('Shutting down.')
+        return 0
+    except OSError as error:
+        print(f'Cannot serve on {args.socket}: {error}', file=sys.stderr)
+        return 1
+    finally:
+        server.close()
+        args.socket.unlink(missing_ok=True)
+        _SERVING.clear()
+        _SERVE_CACHE.clear()
+        sys.stdout, sys.stderr = streams
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+
+def _remove_stale_socket(socket_path: Path) -> str | None:
+    try:
+        socket_path.unlink()
+    except OSError as error:
+        return f'Cannot remove stale socket {socket_path}: {error}'
+    return None
+
+
+def prepare_socket_dir(socket_dir: Path) -> str | None:
+    """Create the private socket directory and check nobody else can use it.
+
+    Parameters
+    ----------
+    socket_dir : Path
+        Directory that will hold the daemon socket.
+
+    Returns
+    -------
+    str | None
+        Reason the directory cannot be trusted, if any.
+    """
+    socket_dir.mkdir(mode=0o700, exist_ok=True)
+    status = socket_dir.lstat()
+    if not stat.S_ISDIR(status.st_mode) or status.st_uid != os.getuid() or status.st_mode & 0o077:
+        return f'{socket_dir} must be a directory owned by the current user with mode 0700.'
+    return None
+
+
+def _serve_forever(server: socket.socket, socket_path: Path, workers: int) -> None:
+    server.bind(str(socket_path))
+    server.listen()
+    request_lock = threading.Lock()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        started = time.perf_counter()
+        projects = list_projects()
+        list(pool.map(warm_project, projects))
+        print(
+            f'Warmed {len(projects)} project(s) in {time.perf_counter() - started:.2f}s; listening on {socket_path}.',
+            flush=True,
+        )
+        while True:
+            connection, _ = server.accept()
+            if (uid := projects_client.peer_uid(connection)) not in {None, os.getuid()}:
+                print(f'Rejected a connection from uid {uid}.', file=sys.stderr)
+                connection.close()
+                continue
+            pool.submit(handle_client, connection, request_lock).add_done_callback(_report_request_error)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the CLI argument parser.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Configured argument parser instance.
+    """
+    parser = argparse.ArgumentParser(
+        description=f"Compile and run C projects against their test cases in '{CASE_DIR_NAME}'.",
+    )
+    parser.add_argument(
+        'projects',
+        nargs='*',
+        help='One or more project directories located at the repository root.',
     )
     parser.add_argument(
         '-a',
@@ -467,6 +2499,34 @@ def build_parser() -> argparse.ArgumentParser:
         '--case',
         help='Run only the specified case for the selected project.',
     )
+    parser.add_argument(
+        '--shard',
+        type=parse_shard,
+        metavar='I/N',
+        help='Run only the I-th of N deterministic partitions of the selected cases.',
+    )
+    parser.add_argument(
+        '--timings',
+        type=Path,
+        help='Previous JSON report used to balance --shard partitions by recorded duration.',
+    )
+    parser.add_argument(
+        '--report',
+        type=Path,
+        help='Write per-case results (with durations and I/O counters) to this JSON file.',
+    )
+    parser.add_argument(
+        '--io-stats',
+        action='store_true',
+        help="Print each case's read/write syscall counts and bytes from /proc/<pid>/io.",
+    )
+    parser.add_argument(
+        '--min-write-bytes',
+        type=int,
+        default=DEFAULT_MIN_WRITE_BYTES,
+        help=f'With --io-stats, flag cases averaging fewer bytes per write (default: {DEFAULT_MIN_WRITE_BYTES}).',
+    )
+    add_stage_argument(parser)
     return parser
 
 
@@ -483,6 +2543,9 @@ def main(argv: list[str]) -> int:
     int
         Shell-style success (0) or failure exit code.
     """
+    if argv and argv[0] in COMMANDS:
+        return COMMANDS[argv[0]](argv[1:])
+
     parser = build_parser()
     args = parser.parse_args(argv)
 
@@ -520,11 +2583,47 @@ def main(argv: list[str]) -> int:
         if len(ordered) != 1:
             print('Specify exactly one project when using --case.', file=sys.stderr)
             return 1
+        if args.shard:
+            print('Cannot combine --shard with --case.', file=sys.stderr)
+            return 1
 
+    try:
+        InputStager(args.stage)
+    except ValueError as error:
+        parser.error(str(error))
+
+    shard_cases: dict[str, set[str | None]] | None = None
+    if args.shard:
+        shard_index, shard_count = args.shard
+        timings = None
+        if args.timings:
+            try:
+                timings = load_case_timings(args.timings)
+            except (OSError, ValueError, KeyError) as error:
+                print(f"Failed to read timings from '{args.timings}': {error}", file=sys.stderr)
+                return 1
+        partitions = partition_work_items(list_work_items(ordered), shard_count, timings)
+        shard_cases = {}
+        for project, case in partitions[shard_index - 1]:
+            shard_cases.setdefault(project, set()).add(case)
+        ordered = [project for project in ordered if project in shard_cases]
+        print(f'Shard {shard_index}/{shard_count}: {sum(map(len, shard_cases.values()))} work item(s).')
+        print()
+
+    results: list[dict[str, Any]] = []
     overall_success = True
     for project in ordered:
         print(f'== Testing project: {project} ==')
-        success, messages = test_project(project, case_name=args.case)
+        success, messages = test_project(
+            project,
+            case_name=args.case,
+            case_names=None if shard_cases is None or None in shard_cases[project] else shard_cases[project],
+            results=results,
+            min_write_bytes=args.min_write_bytes if args.io_stats else None,
+            stage=args.stage,
+        )
+        if not success and not any(entry['project'] == project and not entry['passed'] for entry in results):
+            record_case_result(results, project, None, False, 0.0, '\n'.join(messages))
         if success:
             print('All test cases passed.')
         else:
@@ -533,6 +2632,10 @@ def main(argv: list[str]) -> int:
                 print(message)
         print()
 
+    if args.report:
+        shard = None if args.shard is None else f'{args.shard[0]}/{args.shard[1]}'
+        write_report(args.report, results, shard=shard)
+
     if overall_success:
         print('All requested projects passed their test suites.')
         return 0
@@ -541,5 +2644,15 @@ def main(argv: list[str]) -> int:
     return 2
 
 
+COMMANDS: dict[str, Callable[[list[str]], int]] = {
+    'ab': ab_main,
+    'client': functools.partial(projects_client.main, run_locally=main),
+    'manifest': manifest_main,
+    'merge': merge_main,
+    'minimize': minimize_main,
+    'serve': serve_main,
+}
+
+
 if __name__ == '__main__':
     sys.exit(main(sys.argv[1:]))
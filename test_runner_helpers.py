@@ -0,0 +1,205 @@
+"""Unit tests for the pure helpers behind sharding, minimization and A/B statistics.
+
+``conftest.py`` replaces the collection of ``test_projects.py`` with project
+cases, so the runner's own helpers are tested from this module.
+"""
+
+import argparse
+import math
+import statistics
+from collections.abc import Callable
+
+import pytest
+
+import test_projects
+
+WORK_ITEMS: list[test_projects.WorkItem] = [
+    *((f'project_{project}', f'case_{case:02d}') for project in range(3) for case in range(1, 12)),
+    ('broken_project', None),
+]
+
+
+@pytest.mark.parametrize('shard_count', [1, 2, 3, 7])
+@pytest.mark.parametrize('timings', [None, {('project_0', 'case_01'): 5.0, ('project_1', 'case_02'): 0.5}])
+def test_partition_is_disjoint_and_complete(shard_count: int, timings: dict[tuple[str, str], float] | None) -> None:
+    """Every item lands in exactly one shard, keeping the input order."""
+    shards = test_projects.partition_work_items(WORK_ITEMS, shard_count, timings)
+    assert len(shards) == shard_count
+    flattened = [item for shard in shards for item in shard]
+    assert sorted(flattened, key=str) == sorted(WORK_ITEMS, key=str)
+    for shard in shards:
+        assert shard == [item for item in WORK_ITEMS if item in shard]
+
+
+@pytest.mark.parametrize('timings', [None, {('project_2', 'case_11'): 1.0}])
+def test_partition_is_deterministic(timings: dict[tuple[str, str], float] | None) -> None:
+    """Repeated and reordered calls assign each item to the same shard."""
+    shards = test_projects.partition_work_items(WORK_ITEMS, 4, timings)
+    assert test_projects.partition_work_items(WORK_ITEMS, 4, timings) == shards
+    reordered = test_projects.partition_work_items(WORK_ITEMS[::-1], 4, timings)
+    assert [sorted(shard, key=str) for shard in reordered] == [sorted(shard, key=str) for shard in shards]
+
+
+def test_partition_puts_project_items_in_first_shard() -> None:
+    """A project whose cases cannot be listed fails exactly one shard."""
+    shards = test_projects.partition_work_items(WORK_ITEMS, 3)
+    assert ('broken_project', None) in shards[0]
+
+
+def test_partition_balances_by_timings() -> None:
+    """Longest-first assignment evens out the recorded durations."""
+    durations = [8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0]
+    items: list[test_projects.WorkItem] = [('project', f'case_{index}') for index in range(len(durations))]
+    timings = {(project, case): duration for (project, case), duration in zip(items, durations)}
+    shards = test_projects.partition_work_items(items, 2, timings)
+    loads = [sum(timings[item] for item in shard) for shard in shards]
+    assert loads[0] == loads[1] == sum(durations) / 2
+
+
+def test_partition_estimates_missing_timings_from_project_mean() -> None:
+    """Unrecorded cases count as their project's mean, not as free."""
+    items: list[test_projects.WorkItem] = [('slow', 'a'), ('slow', 'b'), ('slow', 'new'), ('fast', 'a')]
+    timings = {('slow', 'a'): 10.0, ('slow', 'b'): 10.0, ('fast', 'a'): 1.0}
+    shards = test_projects.partition_work_items(items, 3, timings)
+    slow_shards = [index for index, shard in enumerate(shards) for project, _ in shard if project == 'slow']
+    assert sorted(slow_shards) == list(range(len(shards)))
+
+
+@pytest.mark.parametrize(('value', 'expected'), [('1/1', (1, 1)), ('2/4', (2, 4)), ('4/4', (4, 4))])
+def test_parse_shard_accepts_valid_specs(value: str, expected: tuple[int, int]) -> None:
+    """``I/N`` is parsed into a 1-based index and a count."""
+    assert test_projects.parse_shard(value) == expected
+
+
+@pytest.mark.parametrize('value', ['0/3', '4/3', '1/0', '-1/2', '1', 'a/b', '1/2/3', ''])
+def test_parse_shard_rejects_invalid_specs(value: str) -> None:
+    """Out-of-range or malformed specifications are argparse errors."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        test_projects.parse_shard(value)
+
+
+@pytest.mark.parametrize('shards', [['1/3', '3/3', '2/3'], [None], ['1/1']])
+def test_shard_coverage_accepts_complete_sets(shards: list[str | None]) -> None:
+    """Reports covering every shard once can be merged."""
+    assert test_projects.shard_coverage_problem(shards) is None
+
+
+@pytest.mark.parametrize(
+    ('shards', 'fragment'),
+    [
+        (['1/2', '1/2'], 'more than once'),
+        (['1/2'], 'Missing'),
+        (['1/2', '2/3', '3/3'], 'different shard counts'),
+        ([None, '1/2'], 'different shard counts'),
+        (['x'], 'Invalid shard'),
+    ],
+)
+def test_shard_coverage_rejects_inconsistent_sets(shards: list[str | None], fragment: str) -> None:
+    """Duplicated, missing or mismatched shards are reported."""
+    problem = test_projects.shard_coverage_problem(shards)
+    assert problem is not None
+    assert fragment in problem
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        b'3\n1 1\n5 5\n2 2\n',
+        b'3\n1 1\n5 5\n2 2\n0\n',
+        b'3\r\n1 1\r\n5 5\r\n2 2\r\n',
+        b'5 5\n1 5\n2 2 1\n\n\n',
+        b'6\n1\n2\n',
+        b'1 5 Eric\n1 10 John\n0\n',
+        b'no newline',
+        b'',
+    ],
+)
+def test_case_records_round_trip(data: bytes) -> None:
+    """Joining the split parts reproduces the original input byte for byte."""
+    assert test_projects.join_case_records(*test_projects.split_case_records(data)) == data
+
+
+def test_count_header_is_rewritten() -> None:
+    """A lone line count is regenerated and the terminating line is kept."""
+    header, counted, records, trailer = test_projects.split_case_records(b'3\r\na\r\nb\r\nc\r\n0\r\n')
+    assert (header, counted, records, trailer) == (b'3\r\n', True, [b'a\r\n', b'b\r\n', b'c\r\n'], [b'0\r\n'])
+    assert test_projects.join_case_records(header, counted, records[1:], trailer) == b'2\r\nb\r\nc\r\n0\r\n'
+
+
+@pytest.mark.parametrize('data', [b'3 6\n1\n2\n3\n', b'6\n1\n2\n', b'1 5 Eric\n1 10 John\n'])
+def test_other_first_lines_are_fixed_headers(data: bytes) -> None:
+    """A first line that is not a matching count is never a removable record."""
+    header, counted, records, _ = test_projects.split_case_records(data)
+    assert not counted
+    assert header == data.splitlines(keepends=True)[0]
+    assert header not in records
+    assert test_projects.join_case_records(header, counted, [], []) == header
+
+
+def _batch_oracle(predicate: Callable[[list[bytes]], bool]) -> Callable[[list[list[bytes]]], int | None]:
+    def reproduces(candidates: list[list[bytes]]) -> int | None:
+        return next((index for index, candidate in enumerate(candidates) if predicate(candidate)), None)
+
+    return reproduces
+
+
+@pytest.mark.parametrize(
+    ('size', 'needed'),
+    [(1, {0}), (2, {1}), (8, {3}), (16, {2, 13}), (37, {0, 18, 36}), (64, set(range(0, 64, 9)))],
+)
+def test_minimize_records_is_one_minimal(size: int, needed: set[int]) -> None:
+    """Delta debugging keeps exactly the records the failure needs, in order."""
+    records = [f'{index}\n'.encode() for index in range(size)]
+    required = {records[index] for index in needed}
+
+    def fails(candidate: list[bytes]) -> bool:
+        return required <= set(candidate)
+
+    minimized = test_projects.minimize_records(records, _batch_oracle(fails))
+    assert minimized == [record for record in records if record in required]
+    assert all(not fails(minimized[:index] + minimized[index + 1 :]) for index in range(len(minimized)))
+
+
+def test_minimize_records_keeps_input_without_reproducing_subset() -> None:
+    """When only the full input fails, nothing is removed."""
+    records = [b'a\n', b'b\n', b'c\n']
+    assert test_projects.minimize_records(records, _batch_oracle(lambda candidate: candidate == records)) == records
+
+
+def test_summarize_speedup_on_constant_ratio() -> None:
+    """Identical ratios give that speedup with a zero-width interval."""
+    speedup, lower, upper = test_projects.summarize_speedup([2.0, 4.0, 6.0], [1.0, 2.0, 3.0])
+    assert (speedup, lower, upper) == pytest.approx((2.0, 2.0, 2.0))
+
+
+def test_summarize_speedup_on_known_samples() -> None:
+    """The interval is a Student's t interval on the log ratios."""
+    log_ratios = [0.0, 0.2]
+    speedup, lower, upper = test_projects.summarize_speedup([math.exp(ratio) for ratio in log_ratios], [1.0, 1.0])
+    margin = test_projects.T_CRITICAL_95[0] * statistics.stdev(log_ratios) / math.sqrt(len(log_ratios))
+    assert speedup == pytest.approx(math.exp(0.1))
+    assert (lower, upper) == pytest.approx((math.exp(0.1 - margin), math.exp(0.1 + margin)))
+
+
+def test_summarize_speedup_uses_normal_quantile_for_large_samples() -> None:
+    """Beyond the tabulated degrees of freedom the 1.96 quantile is used."""
+    log_ratios = [0.1 * (index % 3) for index in range(len(test_projects.T_CRITICAL_95) + 5)]
+    base = [math.exp(ratio) for ratio in log_ratios]
+    _, lower, upper = test_projects.summarize_speedup(base, [1.0] * len(log_ratios))
+    centre = statistics.fmean(log_ratios)
+    margin = 1.96 * statistics.stdev(log_ratios) / math.sqrt(len(log_ratios))
+    assert (lower, upper) == pytest.approx((math.exp(centre - margin), math.exp(centre + margin)))
+
+
+def test_summarize_speedup_is_symmetric() -> None:
+    """Swapping base and candidate inverts the speedup and its interval."""
+    base, candidate = [1.0, 1.2, 0.9, 1.1], [0.5, 0.7, 0.6, 0.5]
+    speedup, lower, upper = test_projects.summarize_speedup(base, candidate)
+    inverse = test_projects.summarize_speedup(candidate, base)
+    assert inverse == pytest.approx((1 / speedup, 1 / upper, 1 / lower))
+
+
+def test_summarize_speedup_needs_two_samples() -> None:
+    """A single pair cannot produce a confidence interval."""
+    with pytest.raises(ValueError, match='at least'):
+        test_projects.summarize_speedup([1.0], [1.0])